@@ -48,6 +48,12 @@ if __name__ == "__main__":
         default=100,
         help="Number of evaluation samples (default: 100)."
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel worker processes for evaluation mode (default: 1)."
+    )
     args = parser.parse_args()
     match args.mode:
         case "evaluation":
@@ -71,7 +77,8 @@ if __name__ == "__main__":
                 llm_temperature=0,
                 llm_verbose=True,
                 llm_interactive=False,
-                overwrite=False
+                overwrite=False,
+                num_workers=args.workers
             )
         case "generation":
             generate(
@@ -3,6 +3,13 @@ from pathlib import Path
 
 from dts_generation._utils import *
 
+# The script choice only depends on the host platform, so resolve it once at import
+if platform.system() == "Linux":
+    RUN_TIME_SCRIPT_PATH = DECLARATION_SCRIPTS_PATH / "getRunTimeInformation.linux.sh"
+else:
+    RUN_TIME_SCRIPT_PATH = DECLARATION_SCRIPTS_PATH / "getRunTimeInformation.sh"
+GENERATE_DECLARATION_SCRIPT_PATH = DECLARATION_SCRIPTS_PATH / "generateDeclarationFile.sh"
+
 def generate_declarations(
     package_name: str,
     generation_path: Path,
@@ -56,14 +63,10 @@ def generate_declarations(
                             printer(main_path.read_text())
                     # Apply run time information analysis using Jalangi 2
                     with printer(f"Running {RUN_TIME_ANALYZER_PATH.name}:"):
-                        if platform.system() == "Linux":
-                            script_path = DECLARATION_SCRIPTS_PATH / "getRunTimeInformation.linux.sh"
-                        else:
-                            script_path = DECLARATION_SCRIPTS_PATH / "getRunTimeInformation.sh"
                         run_time_path = playground_path / RUN_TIME_ANALYZER_PATH.name / "run_time_info.json"
                         create_dir(run_time_path.parent, overwrite=True)           
                         shell_output = shell(
-                            f"{script_path} {main_path.relative_to(playground_path)} {run_time_path.relative_to(playground_path)} {EXECUTION_TIMEOUT * 2}",
+                            f"{RUN_TIME_SCRIPT_PATH} {main_path.relative_to(playground_path)} {run_time_path.relative_to(playground_path)} {EXECUTION_TIMEOUT * 2}",
                             cwd=playground_path,
                             check=False,
                             timeout=EXECUTION_TIMEOUT,
@@ -75,11 +78,10 @@ def generate_declarations(
                         printer(f"Success")
                     # Generate .d.ts file using dts-generate
                     with printer(f"Running {DECLARATION_GENERATOR_PATH.name}:"):
-                        script_path = DECLARATION_SCRIPTS_PATH / "generateDeclarationFile.sh"
                         declaration_path = playground_path / DECLARATION_GENERATOR_PATH.name
                         create_dir(declaration_path, overwrite=True)
                         shell_output = shell(
-                            f"{script_path} {run_time_path.relative_to(playground_path)} {package_name} {declaration_path.relative_to(playground_path)}",
+                            f"{GENERATE_DECLARATION_SCRIPT_PATH} {run_time_path.relative_to(playground_path)} {package_name} {declaration_path.relative_to(playground_path)}",
                             cwd=playground_path,
                             check=False,
                             timeout=EXECUTION_TIMEOUT,
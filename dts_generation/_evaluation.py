@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import datetime
 import json
 from pathlib import Path
@@ -10,6 +11,24 @@ from dts_generation._utils import *
 from dts_generation._comparison import build_definitely_typed
 from dts_generation._generation import generate
 
+MAX_LENGTH_TRACEBACK_PRINTS = 10_000
+
+def _evaluate_package_worker(kwargs: dict) -> Optional[str]:
+    # Runs in a worker process; only the console is silenced so the per-package log
+    # files keep capturing the run, and expected generation failures come back as
+    # the exception type name, unexpected ones as a trace tail
+    printer.set_console(False)
+    # The fork inherits the parent's open evaluation log in printer._files; drop it
+    # so only the parent writes the summary log and workers write their own logs
+    printer.set_files([])
+    try:
+        generate(**kwargs)
+    except (CommonJSUnsupportedError, ES5UnsupportedError, PackageDataMissingError, PackageInstallationError, LLMRejectedError) as e:
+        return type(e).__name__
+    except Exception:
+        return traceback.format_exc()[-MAX_LENGTH_TRACEBACK_PRINTS:]
+    return None
+
 def evaluate(
     evaluation_path: Path,
     build_path: Path,
@@ -30,7 +49,8 @@ def evaluate(
     llm_model_name: str = "gpt-4o-mini",
     llm_temperature: int = 0,
     llm_verbose: bool = True,
-    llm_interactive: bool = False
+    llm_interactive: bool = False,
+    num_workers: int = 1 # Workers above 1 run packages in parallel processes with suppressed console output
 ) -> None:
     logs_path = evaluation_path / "logs"
     create_dir(logs_path)
@@ -39,6 +59,12 @@ def evaluate(
             with printer("Starting evaluation:"):
                 with printer.with_verbose(verbose):
                     build_definitely_typed(build_path, verbose_setup)
+                    if num_workers > 1:
+                        # Worker processes would otherwise race their lazy builds of these
+                        # shared tools into the same build directories
+                        build_npm_tools(build_path, verbose_setup)
+                        build_run_time_information_gathering(build_path, verbose_setup)
+                        build_ts_declaration_file_generator(build_path, verbose_setup)
                     # Save version data for reproducability
                     versions: dict = dict(
                         date = str(datetime.date.today()),
@@ -73,13 +99,16 @@ def evaluate(
                     length = len(package_names) if length is None else length
                     package_names_subset = package_names[start:start+length]
                 printer(f"Evaluating {len(package_names_subset)} of {len(package_names)} packages ({start}-{start+length})")
-                for i, package_name in enumerate(package_names_subset):
-                    with printer(f"Evaluating package \"{package_name}\" (index: {i+start}):"):
-                        generation_path = evaluation_path / PACKAGES_PATH / escape_package_name(package_name)
-                        try:
-                            generate(
+                if num_workers > 1:
+                    # Packages are independent and dominated by subprocess and network waits,
+                    # so overlap them in worker processes and report results as they finish
+                    printer(f"Running with {num_workers} worker processes (per-package console output is suppressed)")
+                    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                        futures = {}
+                        for i, package_name in enumerate(package_names_subset):
+                            kwargs = dict(
                                 package_name=package_name,
-                                generation_path=generation_path,
+                                generation_path=evaluation_path / PACKAGES_PATH / escape_package_name(package_name),
                                 build_path=build_path,
                                 verbose=verbose,
                                 verbose_setup=verbose_setup,
@@ -95,24 +124,67 @@ def evaluate(
                                 llm_model_name=llm_model_name,
                                 llm_temperature=llm_temperature,
                                 llm_verbose=llm_verbose,
-                                llm_interactive=llm_interactive,
+                                llm_interactive=False, # Interactive prompts cannot reach a worker process
                                 llm_use_cache=False,
                                 combine_examples=True,
                                 combined_only=True,
                                 overwrite=overwrite
                             )
-                        except (CommonJSUnsupportedError, ES5UnsupportedError, PackageDataMissingError, PackageInstallationError, LLMRejectedError) as e:
-                            printer(f"Catched generation exception of type: {type(e).__name__}")
-                        except Exception as e:
-                            if verbose_exceptions:
-                                with printer(f"Catched an unexpected exception:"):
-                                    printer(traceback.format_exc(), end="")
-                                try:
-                                    printer("Waiting for user input: ", end="")
-                                    input()
-                                except (KeyboardInterrupt, EOFError):
-                                    printer(" User aborted")
-                                    exit(0)
+                            futures[executor.submit(_evaluate_package_worker, kwargs)] = (i, package_name)
+                        for future in as_completed(futures):
+                            i, package_name = futures[future]
+                            failure = future.result()
+                            with printer(f"Evaluated package \"{package_name}\" (index: {i+start}):"):
+                                if failure is None:
+                                    printer(f"Success")
+                                elif "\n" in failure:
+                                    if verbose_exceptions:
+                                        with printer(f"Catched an unexpected exception:"):
+                                            printer(failure, end="")
+                                else:
+                                    printer(f"Catched generation exception of type: {failure}")
+                else:
+                    for i, package_name in enumerate(package_names_subset):
+                        with printer(f"Evaluating package \"{package_name}\" (index: {i+start}):"):
+                            generation_path = evaluation_path / PACKAGES_PATH / escape_package_name(package_name)
+                            try:
+                                generate(
+                                    package_name=package_name,
+                                    generation_path=generation_path,
+                                    build_path=build_path,
+                                    verbose=verbose,
+                                    verbose_setup=verbose_setup,
+                                    verbose_execution=verbose_execution,
+                                    verbose_files=verbose_files,
+                                    remove_cache=remove_cache,
+                                    generate_examples=True,
+                                    generate_declarations=True,
+                                    generate_comparisons=True,
+                                    extract_from_readme=extract_from_readme,
+                                    generate_with_llm=generate_with_llm,
+                                    check_es5=check_es5,
+                                    llm_model_name=llm_model_name,
+                                    llm_temperature=llm_temperature,
+                                    llm_verbose=llm_verbose,
+                                    llm_interactive=llm_interactive,
+                                    llm_use_cache=False,
+                                    combine_examples=True,
+                                    combined_only=True,
+                                    overwrite=overwrite
+                                )
+                            except (CommonJSUnsupportedError, ES5UnsupportedError, PackageDataMissingError, PackageInstallationError, LLMRejectedError) as e:
+                                printer(f"Catched generation exception of type: {type(e).__name__}")
+                            except Exception as e:
+                                if verbose_exceptions:
+                                    with printer(f"Catched an unexpected exception:"):
+                                        # Deep npm/node failures can produce huge traces, so only show the tail
+                                        printer(traceback.format_exc()[-MAX_LENGTH_TRACEBACK_PRINTS:], end="")
+                                    try:
+                                        printer("Waiting for user input: ", end="")
+                                        input()
+                                    except (KeyboardInterrupt, EOFError):
+                                        printer(" User aborted")
+                                        exit(0)
                 with printer("Computing metrics:"):
                     sub_metrics: dict = dict(
                         sound = 0,
@@ -185,7 +257,7 @@ def evaluate(
                             old_value = old_value / metrics["usable"] if metrics["usable"] > 0 else 1
                             relative_metrics[mode.name][metric] = f"{old_value:.2%}" # type:ignore
                     relative_metrics_json = json.dumps(relative_metrics, indent=2, ensure_ascii=False)
-                    create_file(metrics_path / "realtive_metrics.json", content=relative_metrics_json)
+                    create_file(metrics_path / "relative_metrics.json", content=relative_metrics_json)
                     if verbose_statistics:
                         with printer(f"Relative metrics:"):
                             printer(relative_metrics_json)
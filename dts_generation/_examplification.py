@@ -1,5 +1,8 @@
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+from io import StringIO
+import json
 from pathlib import Path
 import re
 from typing import Optional
@@ -11,6 +14,29 @@ MAX_LENGTH_FILE_PRINTS = 1
 MAX_LENGTH_FILE_PROMPTS = 10000
 MAX_NUM_TEST_FILES = 3
 MAX_NUM_GENERATION_ATTEMPTS = 3
+MAX_NUM_EXAMPLE_WORKERS = 8
+
+CODE_BLOCK_PATTERN = re.compile(r"```.*?\n(.*?)```", flags=re.DOTALL)
+
+LINE_BREAK_PATTERN = re.compile(r"\r\n?")
+BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+
+def normalize_text(text: str) -> str:
+    # Normalizing line endings and blank runs keeps the prompt prefix byte-stable
+    # across cosmetic file changes, so the provider's prompt cache stays warm
+    text = LINE_BREAK_PATTERN.sub("\n", text)
+    text = BLANK_LINES_PATTERN.sub("\n\n", text)
+    return text.strip()
+
+def truncate_text(text: str, max_length: int) -> str:
+    # Cut at a line break where possible so truncation does not split tokens mid-word
+    if len(text) <= max_length:
+        return text
+    truncated = text[:max_length]
+    line_break = truncated.rfind("\n")
+    if line_break > max_length // 2:
+        return truncated[:line_break + 1]
+    return truncated
 
 def generate_examples(
     package_name: str,
@@ -32,33 +58,129 @@ def generate_examples(
     llm_verbose = llm_verbose or llm_interactive
     with printer(f"Generating examples:"):
         data_json_path = generation_path / DATA_JSON_PATH
-        save_data(data_json_path, "has_repository", False)
-        save_data(data_json_path, "has_package_json", False)
-        save_data(data_json_path, "has_readme", False)
-        save_data(data_json_path, "has_main", False)      
-        save_data(data_json_path, "has_tests", False)
-        save_data(data_json_path, "llm_rejected", False)
+        save_data_many(data_json_path, {
+            "has_repository": False,
+            "has_package_json": False,
+            "has_readme": False,
+            "has_main": False,
+            "has_tests": False,
+            "llm_rejected": False,
+        })
         logs_path = generation_path / LOGS_PATH
         examples_path = generation_path / EXAMPLES_PATH
+        extraction_examples_path = examples_path / EXTRACTION_PATH
+        generation_examples_path = examples_path / GENERATION_PATH
         template_path = generation_path / TEMPLATE_PATH
         playground_path = generation_path / PLAYGROUND_PATH
-        clone_repository(package_name, generation_path, verbose_setup)
+        clone_repository(package_name, generation_path, build_path, verbose_setup)
         package_json = get_package_json(generation_path, verbose_setup)
         readme = get_readme(generation_path, verbose_setup)
-        main = get_main(generation_path, verbose_setup)
-        tests = get_tests(generation_path, verbose_setup)
-        save_data(data_json_path, "has_repository", not dir_empty(generation_path / REPOSITORY_PATH), raise_missing=True)
-        save_data(data_json_path, "has_package_json", file_exists(generation_path / PACKAGE_JSON_PATH), raise_missing=True)
-        save_data(data_json_path, "has_readme", file_exists(generation_path / README_PATH), raise_missing=True)
-        save_data(data_json_path, "has_main", file_exists(generation_path / MAIN_PATH), raise_missing=True)
-        save_data(data_json_path, "has_tests", not dir_empty(generation_path / TESTS_PATH), raise_missing=True)
-        if not readme and not package_json and not main and not tests:
+        # The main and test contents are only consumed by the LLM prompts, and collecting
+        # tests walks the whole repository tree, so skip both on the extraction-only path
+        # and keep the data points and the missing-data gate on cheap existence probes
+        main = get_main(generation_path, verbose_setup, package_json) if generate_with_llm else None
+        tests = get_tests(generation_path, verbose_setup) if generate_with_llm else []
+        has_main = file_exists(generation_path / MAIN_PATH) if generate_with_llm else has_main_file(generation_path, package_json)
+        has_tests = not dir_empty(generation_path / TESTS_PATH) if generate_with_llm else has_test_files(generation_path)
+        save_data_many(data_json_path, {
+            "has_repository": not dir_empty(generation_path / REPOSITORY_PATH),
+            "has_package_json": file_exists(generation_path / PACKAGE_JSON_PATH),
+            "has_readme": file_exists(generation_path / README_PATH),
+            "has_main": has_main,
+            "has_tests": has_tests,
+        }, raise_missing=True)
+        if not readme and not package_json and not has_main and not has_tests:
             raise PackageDataMissingError("Not enough package information found")
         build_template_project(package_name, generation_path, verbose_setup)
         build_npm_tools(build_path, verbose_setup)
 
+        # Construct the LLM client once so all phases share its connection pool
+        if generate_with_llm:
+            lm = GPT(llm_model_name, llm_temperature)
+            agent = Prompter(lm)
+            if llm_interactive:
+                agent.set_debugger(PrintDebugger(partial(printer, end="", flush=True)))
+            if llm_use_cache:
+                agent.set_cache(generation_path / CACHE_PATH / "prompter" / llm_model_name)
+            readable_logger = ReadableLogger(FuncLogger(partial(printer, end="\n\n")))
+            readable_logger.set_verbose(llm_verbose)
+            # Build the shared prompt prefix once so all agents send byte-identical leading
+            # messages, which providers can serve from their prompt cache
+            developer_message = list_text(
+                f"You are an autonomous agent and JavaScript/Node/npm expert",
+                f"The user is a program that can only interact with you in predetermined ways",
+                f"The user will give you a task and instructions on how to complete the task",
+                f"You should try to achieve the task by following the instructions of the user"
+            )
+            package_info_messages = []
+            if readme:
+                package_info_messages.append(
+                    f"Here is the readme file of the package's GitHub repository:"
+                    f"\n{delimit_code(truncate_text(normalize_text(readme), MAX_LENGTH_FILE_PROMPTS), "markdown")}"
+                )
+            if package_json:
+                package_info_messages.append(
+                    f"Here is the package.json file of the package's GitHub repository:"
+                    f"\n{delimit_code(truncate_text(normalize_text(package_json), MAX_LENGTH_FILE_PROMPTS), "json")}"
+                )
+            if main:
+                package_info_messages.append(
+                    f"Here is the main file of the package's GitHub repository:"
+                    f"\n{delimit_code(truncate_text(normalize_text(main), MAX_LENGTH_FILE_PROMPTS), "javascript")}"
+                )
+            if tests:
+                package_info_messages.append(
+                    f"Here are some test files of the package's GitHub repository:"
+                    f"\n{
+                        "\n".join(f"{path}:\n{delimit_code(truncate_text(normalize_text(content), MAX_LENGTH_FILE_PROMPTS), "javascript")}"
+                        for path, content in tests[:MAX_NUM_TEST_FILES])
+                    }"
+                )
+
+        # Reusable helper function for wiring up phase-specific agents
+        def make_agent(tag: str, logger: ListLogger) -> Prompter:
+            sub_agent = agent.get_copy()
+            sub_agent.set_logger(logger)
+            sub_agent.set_tag(tag)
+            return sub_agent
+
+        # Reusable helper function for adding the shared prompt prefix
+        def add_package_info(sub_agent: Prompter) -> None:
+            sub_agent.add_message(developer_message, role="developer")
+            # Crop long messages for print readability
+            readable_logger.set_crop(MAX_LENGTH_FILE_PRINTS)
+            for message in package_info_messages:
+                sub_agent.add_message(message)
+            readable_logger.set_crop()
+
+        # Cache example file contents so combinations do not re-read what was just written
+        example_cache: dict[Path, str] = {}
+
+        # Record written example paths per directory so combinations do not re-list them
+        written_examples: dict[Path, list[Path]] = {}
+
+        # Compile once per call instead of once per tested example
+        require_pattern = re.compile(r'\brequire\s*\(\s*["\'`]' + re.escape(package_name) + r'["\'`]\s*\)', flags=re.ASCII)
+
+        # Reusable helper function for the import check
+        # (the C-level substring scan rejects most non-matches before the regex runs)
+        def has_require(example: str) -> bool:
+            return package_name in example and require_pattern.search(example) is not None
+
+        # Reusable helper function for executing an example in its own playground
+        # (does not print, so it can run on a worker thread; node output is therefore
+        # never live-echoed here even with verbose_execution, only captured and
+        # reported by run_example afterwards)
+        def execute_example(example: str, playground: Path) -> dict:
+            if not has_require(example):
+                return dict(no_require=True)
+            create_dir(playground, template_path, overwrite=True)
+            create_file(playground / "index.js", content=example)
+            shell_output = shell(f"node --no-warnings --no-deprecation index.js", cwd=playground, check=False, timeout=EXECUTION_TIMEOUT, verbose=False)
+            return dict(shell_code=shell_output.code, shell_output=shell_output.value, shell_timeout=shell_output.timeout)
+
         # Reusable helper function for example testing
-        def run_example(example: Optional[str], example_path: Path) -> dict:
+        def run_example(example: Optional[str], example_path: Path, output: Optional[dict] = None) -> dict:
             if example is None:
                 return dict(no_example=True)
             with printer(f"Testing example {example_path.name}"):
@@ -66,27 +188,53 @@ def generate_examples(
                     with printer(f"Example content:"):
                         printer(example)
                 with printer(f"Checking import statements:"):
-                    require_pattern = r'\brequire\s*\(\s*["\'`]' + package_name + r'["\'`]\s*\)'
-                    if not re.search(require_pattern, example):
+                    no_require = output.get("no_require", False) if output is not None else not has_require(example)
+                    if no_require:
                         printer(f"Fail")
                         return dict(no_require=True)
                     printer(f"Success")
-                create_dir(playground_path, template_path, overwrite=True)
-                create_file(playground_path / "index.js", content=example)
+                if output is None:
+                    create_dir(playground_path, template_path, overwrite=True)
+                    create_file(playground_path / "index.js", content=example)
                 with printer(f"Running example with Node:"):
-                    shell_output = shell(f"node index.js", cwd=playground_path, check=False, timeout=EXECUTION_TIMEOUT, verbose=verbose_execution)
-                    if shell_output.code:
+                    if output is None:
+                        shell_output = shell(f"node --no-warnings --no-deprecation index.js", cwd=playground_path, check=False, timeout=EXECUTION_TIMEOUT, verbose=verbose_execution)
+                        output = dict(shell_code=shell_output.code, shell_output=shell_output.value, shell_timeout=shell_output.timeout)
+                    if output["shell_code"]:
                         printer(f"Fail")
                     else:
                         printer(f"Success")
                         create_file(example_path, content=example)
-                    return dict(shell_code=shell_output.code, shell_output=shell_output.value, shell_timeout=shell_output.timeout)
+                        example_cache[example_path] = example
+                        written_examples.setdefault(example_path.parent, []).append(example_path)
+                    return output
+
+        # Reusable helper function for checking if package.json unambiguously declares CommonJS
+        def declares_commonjs() -> bool:
+            # The installed package.json reflects what require() actually resolves,
+            # unlike the repository copy which may lag behind the published version
+            installed_package_json_path = template_path / "node_modules" / package_name / "package.json"
+            try:
+                package_data = json.loads(installed_package_json_path.read_text())
+            except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+                return False
+            if not isinstance(package_data, dict) or package_data.get("type", "commonjs") != "commonjs":
+                return False
+            # An exports map can still restrict require, so only trust a plain main entry
+            if "exports" in package_data:
+                return False
+            main_file = package_data.get("main", "index.js")
+            return isinstance(main_file, str) and not main_file.endswith(".mjs")
 
         # Checking if package is usable
         with printer(f"Checking CommonJS support:"):
-            output = run_example(f"const package = require(\"{package_name}\");", playground_path / "entry.js")
-            if output.get("shell_code", 0):
-                raise CommonJSUnsupportedError(f"Require statement fails on package with error:\n{pad_text(output["shell_output"])}")
+            # Reading package.json takes microseconds where the probe boots a Node process
+            if declares_commonjs():
+                printer(f"Success (declared in package.json)")
+            else:
+                output = run_example(f"const package = require(\"{package_name}\");", playground_path / "entry.js")
+                if output.get("shell_code", 0):
+                    raise CommonJSUnsupportedError(f"Require statement fails on package with error:\n{pad_text(output["shell_output"])}")
 
         # Checking if package supports ES5 syntax
         if check_es5:
@@ -114,63 +262,68 @@ def generate_examples(
                 if len(file_paths) == 0:
                     printer(f"No examples found")
                     return None
-                combined_parts = []
-                for file_path in file_paths:
-                    content = file_path.read_text()
-                    wrapped = (
+                if len(file_paths) == 1:
+                    # A single example needs no scope isolation, so skip the IIFE wrapping
+                    file_path = file_paths[0]
+                    content = example_cache.get(file_path)
+                    if content is None:
+                        content = example_cache[file_path] = file_path.read_text()
+                    printer(f"Success")
+                    return f"// File: {file_path.relative_to(generation_path)}\n\n{content}"
+                buffer = StringIO()
+                for file_index, file_path in enumerate(file_paths):
+                    content = example_cache.get(file_path)
+                    if content is None:
+                        content = example_cache[file_path] = file_path.read_text()
+                    if file_index:
+                        buffer.write("\n\n")
+                    buffer.write(
                         f"// File: {file_path.relative_to(generation_path)}\n\n"
                         f"(function() {"{\n" + pad_text(content, "  ") + "\n}"})();"
                     )
-                    combined_parts.append(wrapped)
                 printer(f"Success")
-                return "\n\n".join(combined_parts)
+                return buffer.getvalue()
 
         def extract_from_readme_helper() -> None:
             with printer(f"Extracting examples from the readme file:"):
                 if not readme:
                     printer(f"No readme file available for extraction")
                     return None
-                examples_sub_path = examples_path / EXTRACTION_PATH
+                examples_sub_path = extraction_examples_path
                 create_dir(examples_sub_path)
-                examples = re.findall( r"```.*?\n(.*?)```", readme, flags=re.DOTALL)
+                examples = CODE_BLOCK_PATTERN.findall(readme)
                 examples = [example.strip() for example in examples]
+                # Readmes often repeat the same snippet, so only test the first occurrence
+                examples = list(dict.fromkeys(examples))
                 printer(f"Found {len(examples)} example(s)")
+                # The Node runs are independent and dominate wall time, so execute them
+                # concurrently in per-example playgrounds and report the results in order
+                outputs: list[dict] = []
+                if examples:
+                    with printer.with_verbose(False):
+                        with ThreadPoolExecutor(max_workers=min(MAX_NUM_EXAMPLE_WORKERS, len(examples))) as executor:
+                            futures = [
+                                executor.submit(execute_example, example, generation_path / CACHE_PATH / f"playground_{example_index}")
+                                for example_index, example in enumerate(examples)
+                            ]
+                            outputs = [future.result() for future in futures]
                 for example_index, example in enumerate(examples):
-                    run_example(example, examples_sub_path / f"{example_index}.js")
+                    run_example(example, examples_sub_path / f"{example_index}.js", outputs[example_index])
             if combine_examples:
                 with printer("Combining extracted examples:"):
                     combined_examples_sub_path = examples_path / COMBINED_EXTRACTION_PATH
                     create_dir(combined_examples_sub_path)
-                    combined_example = combine_files_helper(get_children(examples_sub_path))
+                    combined_example = combine_files_helper(written_examples.get(examples_sub_path, []))
                     run_example(combined_example, combined_examples_sub_path / "0.js")
 
         def generate_with_llm_helper() -> None:
             with printer(f"Generating examples with LLM:"):
-                examples_sub_path = examples_path / GENERATION_PATH
+                examples_sub_path = generation_examples_path
                 create_dir(examples_sub_path)
-                lm = GPT(llm_model_name, llm_temperature)
-                agent = Prompter(lm)
-                if llm_interactive:
-                    agent.set_debugger(PrintDebugger(partial(printer, end="", flush=True)))
-                if llm_use_cache:
-                    agent.set_cache(generation_path / CACHE_PATH / "prompter" / llm_model_name)
-                readable_logger = ReadableLogger(FuncLogger(partial(printer, end="\n\n")))
-                readable_logger.set_verbose(llm_verbose)
-                # Evaluate usability of package
-                with ListLogger(readable_logger, FileLogger(logs_path / f"evaluation.txt")) as logger:
-                    evaluation_agent = agent.get_copy()
-                    evaluation_agent.set_logger(logger)
-                    evaluation_agent.set_tag("evaluation")
-                    evaluation_agent.add_message(
-                        list_text(
-                            f"You are an autonomous agent and JavaScript/Node/npm expert",
-                            f"The user is a program that can only interact with you in predetermined ways",
-                            f"The user will give you a task and instructions on how to complete the task",
-                            f"You should try to achieve the task by following the instructions of the user"
-                        ),
-                        role="developer"
-                    )
-                    evaluation_agent.add_message(
+                with ListLogger(readable_logger, FileLogger(logs_path / f"generation.txt")) as logger:
+                    generation_agent = make_agent("generation", logger)
+                    add_package_info(generation_agent)
+                    generation_agent.add_message(
                         f"Check if the npm package \"{package_name}\" satisfied at least one of the following conditions" + list_text(
                             f"It can only be used in the browser",
                             f"It can only be used with a framework",
@@ -179,79 +332,9 @@ def generate_examples(
                             add_scope=True
                         )
                     )
-                    # Crop long messages for print readability
-                    readable_logger.set_crop(MAX_LENGTH_FILE_PRINTS)
-                    if readme:
-                        evaluation_agent.add_message(
-                            f"Here is the readme file of the package's GitHub repository:"
-                            f"\n{delimit_code(readme[:MAX_LENGTH_FILE_PROMPTS], "markdown")}"
-                        )
-                    if package_json:
-                        evaluation_agent.add_message(
-                            f"Here is the package.json file of the package's GitHub repository:"
-                            f"\n{delimit_code(package_json[:MAX_LENGTH_FILE_PROMPTS], "json")}"
-                        )
-                    if main:
-                        evaluation_agent.add_message(
-                            f"Here is the main file of the package's GitHub repository:"
-                            f"\n{delimit_code(main[:MAX_LENGTH_FILE_PROMPTS], "javascript")}"
-                        )
-                    if tests:
-                        evaluation_agent.add_message(
-                            f"Here are some test files of the package's GitHub repository:"
-                            f"\n{
-                                "\n".join(f"{path}:\n{delimit_code(content[:MAX_LENGTH_FILE_PROMPTS], "javascript")}"
-                                for path, content in tests[:MAX_NUM_TEST_FILES])
-                            }"
-                        )
-                    readable_logger.set_crop()
-                    (choice, data) = evaluation_agent.get_data(
-                        ListI(
-                            "Do the following",
-                            Item(
-                                "think",
-                                TextI(f"Go through each condition step by step and check if it satisfied")
-                            ),
-                            Item(
-                                "choose",
-                                ChoiceI(
-                                    f"Choose one of the following options",
-                                    ListI(
-                                        f"If at least one of the conditions is satisfied",
-                                        Item(
-                                            "satisfied",
-                                            TextI(f"Explain which conditions are satisfied")
-                                        )
-                                    ),
-                                    ListI(
-                                        f"Otherwise",
-                                        Item("unsatisfied")
-                                    )
-                                )
-                            ),
-                            add_stop=True
-                        )
-                    )[1]
-                    match choice, data[0]:
-                        case "satisfied", _:
-                            raise LLMRejectedError(f"The LLM determined that this package is currently not supported")
-                # Generate package examples
-                with ListLogger(readable_logger, FileLogger(logs_path / f"generation.txt")) as logger:
-                    generation_agent = agent.get_copy()
-                    generation_agent.set_logger(logger)
-                    generation_agent.set_tag("generation")
-                    generation_agent.add_message(
-                        list_text(
-                            f"You are an autonomous agent and JavaScript/Node/npm expert",
-                            f"The user is a program that can only interact with you in predetermined ways",
-                            f"The user will give you a task and instructions on how to complete the task",
-                            f"You should try to achieve the task by following the instructions of the user"
-                        ),
-                        role="developer"
-                    )
                     generation_agent.add_message(
                         list_text(
-                            f"Your task is to create an example for the npm package \"{package_name}\" with the following requirements " + list_text(
+                            f"If none of the conditions are satisfied, your task is to create an example for the npm package \"{package_name}\" with the following requirements " + list_text(
                                 f"It should import the package using CommonJS style imports",
                                 f"It should use as much functionality of the package as is possible",
                                 f"It should not require user inputs",
@@ -261,35 +344,74 @@ def generate_examples(
                             )
                         )
                     )
-                    # Crop long messages for print readability
-                    readable_logger.set_crop(MAX_LENGTH_FILE_PRINTS)
-                    if readme:
-                        generation_agent.add_message(
-                            f"Here is the readme file of the package's GitHub repository:"
-                            f"\n{delimit_code(readme[:MAX_LENGTH_FILE_PROMPTS], "markdown")}"
-                        )
-                    if package_json:
-                        generation_agent.add_message(
-                            f"Here is the package.json file of the package's GitHub repository:"
-                            f"\n{delimit_code(package_json[:MAX_LENGTH_FILE_PROMPTS], "json")}"
-                        )
-                    if main:
-                        generation_agent.add_message(
-                            f"Here is the main file of the package's GitHub repository:"
-                            f"\n{delimit_code(main[:MAX_LENGTH_FILE_PROMPTS], "javascript")}"
-                        )
-                    if tests:
-                        generation_agent.add_message(
-                            f"Here are some test files of the package's GitHub repository:"
-                            f"\n{
-                                "\n".join(f"{path}:\n{delimit_code(content[:MAX_LENGTH_FILE_PROMPTS], "javascript")}"
-                                for path, content in tests[:MAX_NUM_TEST_FILES])
-                            }"
-                        )
-                    readable_logger.set_crop()
+                    # Evaluate usability and generate the first example in a single round trip
+                    with printer(f"Generating example 0:"):
+                        (choice, data) = generation_agent.get_data(
+                            ListI(
+                                "Do the following",
+                                Item(
+                                    "think",
+                                    TextI(f"Go through each condition step by step and check if it satisfied")
+                                ),
+                                Item(
+                                    "choose",
+                                    ChoiceI(
+                                        f"Choose one of the following options",
+                                        ListI(
+                                            f"If at least one of the conditions is satisfied",
+                                            Item(
+                                                "satisfied",
+                                                TextI(f"Explain which conditions are satisfied")
+                                            )
+                                        ),
+                                        ListI(
+                                            f"Otherwise",
+                                            Item(
+                                                "think",
+                                                TextI(f"Go through each requirement step by step and think about how you are going to satisfy it")
+                                            ),
+                                            Item(
+                                                "example",
+                                                CodeI(f"Provide the content of the example", "javascript")
+                                            )
+                                        )
+                                    )
+                                ),
+                                add_stop=True
+                            )
+                        )[1]
+                        match choice:
+                            case "satisfied":
+                                raise LLMRejectedError(f"The LLM determined that this package is currently not supported")
+                        example = data[-1]
+                        printer(f"Success")
                     # Reprompt LLM for an example until the example is valid
+                    # (each reprompt feeds the previous attempt's Node output back to the LLM, so attempts cannot overlap)
                     example_index = 0
                     while True:
+                        with printer(f"Checking example {example_index}:"):
+                            output = run_example(example, examples_sub_path / f"{example_index}.js")
+                            example_index += 1
+                            if output.get("no_require", False):
+                                generation_agent.add_message(
+                                    f"Your example does not contain an import statement for the package e.g. \"require('{package_name}')\"."
+                                    f"\nAdd an import statement for the package with the exact package name i.e. \"{package_name}\"."
+                                )
+                            elif output.get("shell_code", 0):
+                                if output.get("shell_timeout", False):
+                                    generation_agent.add_message(
+                                        f"Running your example with Node did not finish after {EXECUTION_TIMEOUT} seconds:"
+                                        f"\n{delimit_code(output["shell_output"][-MAX_LENGTH_FILE_PROMPTS:], "shell")}"
+                                        f"\nMake the example complete in under {EXECUTION_TIMEOUT} seconds and wait for user inputs."
+                                    )
+                                else:
+                                    generation_agent.add_message(
+                                        f"Running your example with Node failed with code {output["shell_code"]}:"
+                                        f"\n{delimit_code(output["shell_output"][-MAX_LENGTH_FILE_PROMPTS:], "shell")}"
+                                        f"\nFix the error."
+                                    )
+                            else:
+                                break
                         with printer(f"Generating example {example_index}:"):
                             if example_index >= MAX_NUM_GENERATION_ATTEMPTS:
                                 printer(f"Failed (too many attempts)")
@@ -309,35 +431,11 @@ def generate_examples(
                                     )
                                 )[1]
                             printer(f"Success")
-                        with printer(f"Checking example {example_index}:"):
-                            output = run_example(example, examples_sub_path / f"{example_index}.js")
-                            example_index += 1
-                            if output.get("require_missing", False):
-                                generation_agent.add_message(
-                                    f"Your example does not contain an import statement for the package e.g. \"require('{package_name}')\"."
-                                    f"\nAdd an import statement for the package with the exact package name i.e. \"{package_name}\"."
-                                )
-                                continue
-                            if output.get("shell_code", 0):
-                                if output.get("shell_timeout", False):
-                                    generation_agent.add_message(
-                                        f"Running your example with Node did not finish after {EXECUTION_TIMEOUT} seconds:"
-                                        f"\n{delimit_code(output["shell_output"][:MAX_LENGTH_FILE_PROMPTS], "shell")}"
-                                        f"\nMake the example complete in under {EXECUTION_TIMEOUT} seconds and wait for user inputs."
-                                    )
-                                    continue
-                                generation_agent.add_message(
-                                    f"Running your example with Node failed with code {output["shell_code"]}:"
-                                    f"\n{delimit_code(output["shell_output"][:MAX_LENGTH_FILE_PROMPTS], "shell")}"
-                                    f"\nFix the error."
-                                )
-                                continue
-                            break
             if combine_examples:
                 with printer("Combining generated examples:"):
                     combined_examples_sub_path = examples_path / COMBINED_GENERATION_PATH
                     create_dir(combined_examples_sub_path)
-                    combined_example = combine_files_helper(get_children(examples_sub_path))
+                    combined_example = combine_files_helper(written_examples.get(examples_sub_path, []))
                     run_example(combined_example, combined_examples_sub_path / "0.js")
 
         # doing generation first, can be faster because of llm rejection
@@ -349,6 +447,6 @@ def generate_examples(
             with printer("Combining all examples:"):
                 combined_examples_sub_path = examples_path / COMBINED_ALL_PATH
                 create_dir(combined_examples_sub_path)
-                paths = get_children(examples_path / EXTRACTION_PATH) + get_children(examples_path / GENERATION_PATH)
+                paths = written_examples.get(extraction_examples_path, []) + written_examples.get(generation_examples_path, [])
                 combined_example = combine_files_helper(paths)
                 run_example(combined_example, combined_examples_sub_path / "0.js")
\ No newline at end of file
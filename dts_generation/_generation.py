@@ -1,5 +1,6 @@
 from pathlib import Path
 import shutil
+import threading
 
 from dts_generation._utils import *
 from dts_generation._examplification import generate_examples as generate_examples_helper
@@ -31,23 +32,24 @@ def generate(
     llm_use_cache: bool = False
 ) -> None:
     create_dir(generation_path, overwrite=overwrite)
-    if not dir_empty(generation_path / DATA_PATH):
+    # An overwritten directory is empty by construction, so only probe on reuse
+    if not overwrite and not dir_empty(generation_path / DATA_PATH):
         printer(f"Skipping generation for \"{package_name}\" (already generated)")
         return None
-    create_dir(generation_path / DATA_PATH)
-    create_dir(generation_path / LOGS_PATH)
-    create_dir(generation_path / EXAMPLES_PATH)
-    create_dir(generation_path / DECLARATIONS_PATH)
-    create_dir(generation_path / COMPARISONS_PATH)
+    for sub_path in (DATA_PATH, LOGS_PATH, EXAMPLES_PATH, DECLARATIONS_PATH, COMPARISONS_PATH):
+        create_dir(generation_path / sub_path)
     data_json_path = generation_path / DATA_JSON_PATH
-    save_data(data_json_path, "usable", False)
-    save_data(data_json_path, "package_data_missing", False)
-    save_data(data_json_path, "package_installation_failed", False)
-    save_data(data_json_path, "es5_unsupported", False)
-    save_data(data_json_path, "commonjs_unsupported", False)
-    save_data(data_json_path, "unexpected_exception", False)
-    save_data(data_json_path, "llm_rejected_error", False)
-    with open(generation_path / LOGS_PATH / "shell.txt", "w") as log_file:
+    save_data_many(data_json_path, {
+        "usable": False,
+        "package_data_missing": False,
+        "package_installation_failed": False,
+        "es5_unsupported": False,
+        "commonjs_unsupported": False,
+        "unexpected_exception": False,
+        "llm_rejected_error": False,
+    })
+    # A large buffer batches the many small printer writes into few syscalls
+    with open(generation_path / LOGS_PATH / "shell.txt", "w", buffering=1 << 16) as log_file:
         with printer.with_file(log_file):
             with printer(f"Starting generation for \"{package_name}\":"):
                 try:
@@ -113,4 +115,11 @@ def generate(
                 finally:
                     printer(f"Finished generation for \"{package_name}\"")
                     if remove_cache:
-                        shutil.rmtree(generation_path / "cache", ignore_errors=True)
\ No newline at end of file
+                        # Unlinking a large cache can take seconds and nothing reads it
+                        # afterwards, so let it proceed while the next package starts
+                        threading.Thread(
+                            target=shutil.rmtree,
+                            args=(generation_path / CACHE_PATH,),
+                            kwargs=dict(ignore_errors=True),
+                            daemon=True,
+                        ).start()
\ No newline at end of file
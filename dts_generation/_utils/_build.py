@@ -1,18 +1,24 @@
 import json
+import os
 from pathlib import Path
 from typing import Optional
 
-from dts_generation._utils._helpers import create_dir, create_file, dir_empty, get_children, file_exists
+from dts_generation._utils._helpers import create_dir, create_file, dir_empty, escape_package_name, get_children, file_exists, read_text_lenient
 from dts_generation._utils._shell import ShellError, shell
 from dts_generation._utils._printer import printer
-from dts_generation._utils._shared import CACHE_PATH, DATA_PATH, DECLARATION_SCRIPTS_PATH, TEMPLATE_PATH, PackageDataMissingError, PackageInstallationError, INSTALLATION_TIMEOUT
+from dts_generation._utils._shared import CACHE_PATH, DATA_PATH, DECLARATION_SCRIPTS_PATH, DONE_MARKER_PATH, TEMPLATE_PATH, PackageDataMissingError, PackageInstallationError, INSTALLATION_TIMEOUT
 
 RUN_TIME_ANALYZER_PATH = Path("run-time-information-analyzer")
 DECLARATION_GENERATOR_PATH = Path("ts-declaration-file-generator")
 DEFINITELY_TYPED_PATH = Path("DefinitelyTyped")
 NPM_TOOLS_PATH = Path("npm-tools")
+MAX_TEST_FILE_SIZE = 1_000_000
+TEST_DIRS = frozenset({"test", "tests", "__tests__"})
+TEST_SUFFIXES = (".test.js", ".spec.js")
+MAIN_NAMES = ("index.js", "index.json", "index.node")
 TRANSPILE_PATH = NPM_TOOLS_PATH / "transpile.js"
 REPOSITORY_PATH = CACHE_PATH / "repository"
+REPOSITORY_STORE_PATH = Path("repositories")
 PACKAGE_JSON_PATH = DATA_PATH / "package.json"
 README_PATH = DATA_PATH / "README.md"
 MAIN_PATH = DATA_PATH / "index.js"
@@ -25,9 +31,9 @@ def build_definitely_typed(build_path: Path, verbose_setup: bool) -> None:
             if not dir_empty(output_path):
                 printer(f"Success (already cloned)")
                 return
-            create_dir(output_path, overwrite=True)
+            create_dir(output_path)
             shell(
-                f"git clone --depth 1 https://github.com/DefinitelyTyped/DefinitelyTyped.git {output_path}",
+                f"git clone --depth 1 --single-branch --no-tags https://github.com/DefinitelyTyped/DefinitelyTyped.git {output_path}",
                 timeout=INSTALLATION_TIMEOUT,
                 verbose=verbose_setup
             )
@@ -41,9 +47,9 @@ def build_run_time_information_gathering(build_path: Path, verbose_setup: bool)
             if not dir_empty(output_path):
                 printer(f"Success (already build)")
                 return None
-            create_dir(output_path, overwrite=True)
+            create_dir(output_path)
             shell(
-                f"git clone --depth 1 https://github.com/Proglang-TypeScript/run-time-information-gathering.git {output_path}",
+                f"git clone --depth 1 --single-branch --no-tags https://github.com/Proglang-TypeScript/run-time-information-gathering.git {output_path}",
                 timeout=INSTALLATION_TIMEOUT,
                 verbose=verbose_setup
             )
@@ -62,9 +68,9 @@ def build_ts_declaration_file_generator(build_path: Path, verbose_setup: bool) -
             if not dir_empty(output_path):
                 printer(f"Success (already build)")
                 return None
-            create_dir(output_path, overwrite=True)
+            create_dir(output_path)
             shell(
-                f"git clone --depth 1 https://github.com/Proglang-TypeScript/ts-declaration-file-generator.git {output_path}",
+                f"git clone --depth 1 --single-branch --no-tags https://github.com/Proglang-TypeScript/ts-declaration-file-generator.git {output_path}",
                 timeout=INSTALLATION_TIMEOUT,
                 verbose=verbose_setup
             )
@@ -78,16 +84,18 @@ def build_npm_tools(build_path: Path, verbose_setup: bool) -> None:
     with printer.with_verbose(verbose_setup):
         with printer(f"Building npm tools:"):
             output_path = build_path / NPM_TOOLS_PATH
-            if not dir_empty(output_path) and (output_path / "transpile.js").is_file():
+            # Only skip when the installed tree is actually present, so a failed
+            # npm ci does not leave a half-built directory that passes the guard
+            if (output_path / "transpile.js").is_file() and not dir_empty(output_path / "node_modules"):
                 printer(f"Success (already build)")
                 return None
-            create_dir(output_path, overwrite=True)
+            create_dir(output_path)
             create_file(output_path / "package.json", DECLARATION_SCRIPTS_PATH / "package.json")
             create_file(output_path / "package-lock.json", DECLARATION_SCRIPTS_PATH / "package-lock.json")
             create_file(output_path / "transpile.js", DECLARATION_SCRIPTS_PATH / "transpile.js")
             shell(
                 # f"npm install @babel/core @babel/preset-env esbuild", # dont use this because of reproducability,
-                f"npm ci",
+                f"npm ci --no-audit --no-fund",
                 cwd=output_path,
                 timeout=INSTALLATION_TIMEOUT,
                 verbose=verbose_setup
@@ -98,28 +106,37 @@ def build_template_project(package_name: str, generation_path: Path, verbose_set
     with printer.with_verbose(verbose_setup):
         with printer(f"Building template npm project:"):
             output_path = generation_path / TEMPLATE_PATH
-            if not dir_empty(output_path):
+            # A marker file is one stat call, where checking emptiness scans the whole node_modules tree
+            if (output_path / DONE_MARKER_PATH).is_file():
                 printer("Success (already build)")
                 return None
             create_dir(output_path, overwrite=True)
             with printer(f"Installing packages:"):
                 data_path = generation_path / DATA_PATH
                 try:
-                    shell(f"npm install tsx typescript @types/node {package_name}", cwd=output_path, timeout=INSTALLATION_TIMEOUT, verbose=verbose_setup)
+                    shell(f"npm install --no-audit --no-fund tsx typescript @types/node {package_name}", cwd=output_path, timeout=INSTALLATION_TIMEOUT, verbose=verbose_setup)
                     create_file(data_path / "package.json", output_path / "package.json")
                     create_file(data_path / "package-lock.json", output_path / "package-lock.json")
+                    (output_path / DONE_MARKER_PATH).touch()
                     printer(f"Success")
                 except ShellError as e:
                     raise PackageInstallationError(f"Running npm install {package_name} failed") from e
 
-def clone_repository(package_name: str, generation_path: Path, verbose_setup: bool) -> None:#
+def clone_repository(package_name: str, generation_path: Path, build_path: Path, verbose_setup: bool) -> None:#
     with printer.with_verbose(verbose_setup):
         with printer(f"Cloning the GitHub repository:"):
             output_path = generation_path / REPOSITORY_PATH
-            if not dir_empty(output_path):
+            # A marker file is one stat call, where checking emptiness scans the whole repository tree
+            if (output_path / DONE_MARKER_PATH).is_file():
                 printer(f"Success (already cloned)")
                 return None
-            create_dir(output_path)
+            # Clones are shared across generation directories, so repeat runs on the
+            # same package link the stored tree instead of hitting the network again
+            store_path = build_path / REPOSITORY_STORE_PATH / escape_package_name(package_name)
+            if (store_path / DONE_MARKER_PATH).is_file():
+                create_dir(output_path, store_path, overwrite=True)
+                printer(f"Success (from store)")
+                return None
             try:
                 shell_output = shell(f"npm view {package_name} repository --json", timeout=INSTALLATION_TIMEOUT, verbose=verbose_setup)
             except ShellError as e:
@@ -134,18 +151,24 @@ def clone_repository(package_name: str, generation_path: Path, verbose_setup: bo
             if "github.com" not in url:
                 raise PackageDataMissingError(f"No GitHub URL found")
             github_url = "https://github.com" + url.split("github.com", 1)[-1].split(".git")[0]
+            create_dir(store_path, overwrite=True)
             try:
-                shell(f"git clone --depth 1 {github_url} {output_path}", timeout=INSTALLATION_TIMEOUT, verbose=verbose_setup)
+                shell(f"git clone --depth 1 --single-branch --no-tags {github_url} {store_path}", timeout=INSTALLATION_TIMEOUT, verbose=verbose_setup)
             except ShellError as e:
                 raise PackageDataMissingError(f"Git clone failed") from e
-            if dir_empty(output_path):
+            if dir_empty(store_path):
                 raise PackageDataMissingError(f"Repository clone is empty")
+            (store_path / DONE_MARKER_PATH).touch()
+            create_dir(output_path, store_path, overwrite=True)
             printer(f"Success")
 
 def get_package_json(generation_path: Path, verbose_setup: bool) -> Optional[str]:
     with printer.with_verbose(verbose_setup):
         package_json_path = generation_path / REPOSITORY_PATH / "package.json"
         output_path = generation_path / PACKAGE_JSON_PATH
+        if output_path.is_file():
+            printer(f"Package file found (cached)")
+            return output_path.read_text()
         if package_json_path.is_file():
             try:
                 package_json = package_json_path.read_text()
@@ -160,27 +183,52 @@ def get_readme(generation_path: Path, verbose_setup: bool) -> Optional[str]:
     with printer.with_verbose(verbose_setup):
         repository_path = generation_path / REPOSITORY_PATH
         output_path = generation_path / README_PATH
-        for readme_path in get_children(repository_path):
-            if readme_path.is_file() and "readme" in readme_path.name.lower():
-                try:
-                    readme = readme_path.read_text()
-                    create_file(output_path, content=readme)
-                    printer(f"Readme file found")
-                    return readme_path.read_text()
-                except UnicodeDecodeError:
-                    pass
+        if output_path.is_file():
+            printer(f"Readme file found (cached)")
+            return output_path.read_text()
+        # Nearly every repository uses the canonical name, so probe it before scanning
+        if (repository_path / "README.md").is_file():
+            readme_paths = [repository_path / "README.md"]
+        else:
+            # DirEntry.is_file uses the type bits from the directory read, avoiding per-entry stats
+            try:
+                with os.scandir(repository_path) as entries:
+                    readme_paths = sorted(
+                        (Path(entry.path) for entry in entries if entry.is_file() and "readme" in entry.name.lower()),
+                        key=lambda path: path.name
+                    )
+            except (FileNotFoundError, NotADirectoryError):
+                readme_paths = []
+        for readme_path in readme_paths:
+            try:
+                readme = readme_path.read_text()
+                create_file(output_path, content=readme)
+                printer(f"Readme file found")
+                return readme
+            except UnicodeDecodeError:
+                pass
         printer(f"No readme file found")
 
-def get_main(generation_path: Path, verbose_setup: bool) -> Optional[str]:
+def get_main(generation_path: Path, verbose_setup: bool, package_json: Optional[str] = None) -> Optional[str]:
     with printer.with_verbose(verbose_setup):
         repository_path = generation_path / REPOSITORY_PATH
         package_json_path = repository_path / "package.json"
         output_path = generation_path / MAIN_PATH
-        if package_json_path.is_file():
+        if output_path.is_file():
+            printer(f"Main file found (cached)")
+            return output_path.read_text()
+        # Callers that already hold the package.json content can pass it in,
+        # saving a read and decode of the same file
+        if package_json is None and package_json_path.is_file():
+            try:
+                package_json = package_json_path.read_text()
+            except UnicodeDecodeError:
+                pass
+        if package_json:
             # Check if package.json contains a main file reference
             try:
-                package_json = json.loads(package_json_path.read_text())
-                main_path = repository_path / package_json["main"]
+                package_data = json.loads(package_json)
+                main_path = repository_path / package_data["main"]
                 if main_path.is_file():
                     try:
                         main = main_path.read_text()
@@ -192,8 +240,7 @@ def get_main(generation_path: Path, verbose_setup: bool) -> Optional[str]:
             except (json.JSONDecodeError, KeyError):
                 pass
             # Fallback: search for common main file names
-            main_names = ["index.js", "index.json", "index.node"]
-            for name in main_names:
+            for name in MAIN_NAMES:
                 main_path = repository_path / name
                 if main_path.is_file():
                     try:
@@ -205,35 +252,63 @@ def get_main(generation_path: Path, verbose_setup: bool) -> Optional[str]:
                         pass
             printer(f"No main file found")
 
+def has_main_file(generation_path: Path, package_json: Optional[str] = None) -> bool:
+    # Existence-only variant of get_main for callers that never read the content
+    repository_path = generation_path / REPOSITORY_PATH
+    if package_json:
+        try:
+            if (repository_path / json.loads(package_json)["main"]).is_file():
+                return True
+        except (json.JSONDecodeError, KeyError, TypeError):
+            pass
+    return any((repository_path / name).is_file() for name in MAIN_NAMES)
+
 def get_tests(generation_path: Path, verbose_setup: bool) -> list[tuple[str, str]]:
     with printer.with_verbose(verbose_setup):
         tests = {}
         repository_path = generation_path / REPOSITORY_PATH
         output_path = generation_path / TESTS_PATH
+        if not dir_empty(output_path):
+            # Reuse the test files extracted by a previous run instead of rescanning the repository
+            cached_tests = []
+            for file_path in get_children(output_path):
+                header, _, content = file_path.read_text().partition("\n\n")
+                cached_tests.append((header.removeprefix("// File: "), content))
+            printer(f"{len(cached_tests)} test file(s) found (cached)")
+            return cached_tests
         create_dir(output_path)
-        # Check well-known test directories
-        test_dirs = ["test", "tests", "__tests__"]
-        for d in test_dirs:
-            test_path = repository_path / d
-            if test_path.is_dir():
-                for f in test_path.rglob("*.js"):
-                    if f.is_file():
-                        try:
-                            tests[f.relative_to(repository_path)] = f.read_text()
-                        except UnicodeDecodeError:
-                            pass
-        # Check repo for suffixes
-        test_suffixes = [".test.js", ".spec.js"]
-        for suffix in test_suffixes:
-            for f in repository_path.rglob(f"*{suffix}"):
-                if f.suffix ==".js":
-                    if f.is_file():
-                        try:
-                            tests[f.relative_to(repository_path)] = f.read_text()
-                        except UnicodeDecodeError:
-                            pass
-        tests = [(path, content) for path, content in sorted(tests.items()) if content]
+        # One walk covers both the well-known test directories and the repo-wide
+        # suffix matches, instead of several rglob traversals over the same tree
+        for dir_path, _, file_names in os.walk(repository_path):
+            rel_parts = Path(dir_path).relative_to(repository_path).parts
+            in_test_dir = bool(rel_parts) and rel_parts[0] in TEST_DIRS
+            for file_name in file_names:
+                if file_name.endswith(".js") and (in_test_dir or file_name.endswith(TEST_SUFFIXES)):
+                    f = Path(dir_path) / file_name
+                    try:
+                        if f.stat().st_size > MAX_TEST_FILE_SIZE:
+                            continue
+                    except OSError:
+                        continue
+                    content = read_text_lenient(f)
+                    if content is not None:
+                        tests[f.relative_to(repository_path)] = content
+        # Repositories often ship the same test twice (e.g. source and build copies),
+        # so keep only the first occurrence of each content
+        seen_contents = set()
+        unique_tests = []
+        for path, content in sorted(tests.items()):
+            if content and content not in seen_contents:
+                seen_contents.add(content)
+                unique_tests.append((path, content))
+        tests = unique_tests
         for i, (path, content) in enumerate(tests):
             (output_path / f"{i}.js").write_text(f"// File: {path}\n\n{content}")
         printer(f"{len(tests)} test file(s) found")
-        return tests
\ No newline at end of file
+        return tests
+
+def has_test_files(generation_path: Path) -> bool:
+    # Existence-only variant of get_tests that only probes the well-known test
+    # directories instead of walking the whole repository tree
+    repository_path = generation_path / REPOSITORY_PATH
+    return any(not dir_empty(repository_path / name) for name in TEST_DIRS)
\ No newline at end of file
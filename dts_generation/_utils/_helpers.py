@@ -1,4 +1,6 @@
+import functools
 import json
+import os
 from pathlib import Path
 import shutil
 from typing import Any, Optional
@@ -9,34 +11,58 @@ def create_dir(dst_path: Path, src_path: Optional[Path] = None, overwrite: bool
     if src_path is None:
         dst_path.mkdir(parents=True, exist_ok=True)
     else:
-        shutil.copytree(src_path, dst_path, dirs_exist_ok=True, symlinks=True)
+        try:
+            # Hardlinks share the source's file data, e.g. avoiding full node_modules copies
+            shutil.copytree(src_path, dst_path, dirs_exist_ok=True, symlinks=True, copy_function=os.link)
+        except OSError:
+            # Fall back to real copies e.g. when source and destination are on different devices
+            shutil.copytree(src_path, dst_path, dirs_exist_ok=True, symlinks=True)
 
 def create_file(dst_path: Path, src_path: Optional[Path] = None, content: Optional[str] = None) -> None:
-    create_dir(dst_path.parent)
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
     if src_path is None:
         dst_path.write_text("" if content is None else content)
     else:
-        dst_path.write_text(src_path.read_text())
+        # copyfile moves the bytes in-kernel instead of decoding and re-encoding text
+        shutil.copyfile(src_path, dst_path)
 
+# Pure string transforms called once per stage per package, so memoize across calls
+@functools.lru_cache(maxsize=None)
 def escape_package_name(package_name: str) -> str:
     if package_name.startswith("@"):
         scope, package_name = package_name[1:].split("/", 1)
         return f"{scope}__{package_name}"
     return package_name
 
+@functools.lru_cache(maxsize=None)
 def unescape_package_name(name: str) -> str:
     if "__" in name:
         scope, pkg = name.split("__", 1)
         return f"@{scope}/{pkg}"
     return name
 
+def read_text_lenient(file_path: Path) -> Optional[str]:
+    # Decoding with replacement avoids exception-based control flow on binary files
+    text = file_path.read_text(encoding="utf-8", errors="replace")
+    if text.count("�") > len(text) // 100:
+        return None
+    return text
+
 def get_children(dir_path: Path) -> list[Path]:
-    if not dir_path.is_dir():
+    # scandir reads the directory in one pass without the separate is_dir stat
+    try:
+        with os.scandir(dir_path) as entries:
+            return sorted((Path(entry.path) for entry in entries), key=lambda path: path.name)
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted(dir_path.iterdir(), key=lambda path: path.name)
 
 def dir_empty(dir_path: Path) -> bool:
-    return not (dir_path.is_dir() and any(dir_path.iterdir()))
+    # scandir stops at the first entry and skips the extra is_dir stat
+    try:
+        with os.scandir(dir_path) as entries:
+            return next(iter(entries), None) is None
+    except (FileNotFoundError, NotADirectoryError):
+        return True
 
 def file_exists(file_path: Path) -> bool:
     return file_path.is_file()
@@ -70,4 +96,16 @@ def save_data(file_path: Path, key: str, value: Any, raise_missing: bool = False
     if raise_overwrite:
         raise KeyError(f"Key {key!r} already exists at {file_path}") 
     data[key] = value
+    file_path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+
+def save_data_many(file_path: Path, values: dict[str, Any], raise_missing: bool = False) -> None:
+    # Reads and rewrites the file once for the whole batch instead of once per key
+    data = {}
+    if file_path.is_file():
+        data = json.loads(file_path.read_text())
+    if raise_missing:
+        for key in values:
+            if key not in data:
+                raise KeyError(f"Key {key!r} not found at {file_path}")
+    data.update(values)
     file_path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
\ No newline at end of file
@@ -32,14 +32,21 @@ class Printer:
         self._new_line = True
         self.set_padding()
         self.set_verbose()
+        self.set_console()
         self.set_files([])
-    
+
     def set_verbose(self, verbose: bool = True) -> None:
         self._verbose = verbose
 
     def get_verbose(self) -> bool:
         return self._verbose
 
+    def set_console(self, console: bool = True) -> None:
+        self._console = console
+
+    def get_console(self) -> bool:
+        return self._console
+
     def set_padding(self, padding: str = "  ") -> Self:
         self._padding = padding
         return self
@@ -76,18 +83,26 @@ class Printer:
     def __call__(self, text: str = "", end: str = "\n", flush: bool = True) -> Self:
         if not self._verbose:
             return self
+        # Most calls are single lines, so compute the prefix once and only pay for
+        # the replace pass when the text actually contains inner line breaks
+        prefix = self._padding * self._level
         text += end
         if self._new_line:
             self._new_line = False
-            text = self._padding * self._level + text
+            if prefix:
+                text = prefix + text
         if text.endswith("\n"):
             self._new_line = True
-            text = text[:-1].replace("\n", "\n" + self._padding * self._level) + "\n"
-        else:
-            text = text.replace("\n", "\n" + self._padding * self._level)
-        print(text, end="", flush=flush)
+            if prefix and "\n" in text[:-1]:
+                text = text[:-1].replace("\n", "\n" + prefix) + "\n"
+        elif prefix and "\n" in text:
+            text = text.replace("\n", "\n" + prefix)
+        if self._console:
+            print(text, end="", flush=flush)
+        # The text is already fully formatted, so write it to the log files directly;
+        # they are only read after the run and flush on their own
         for file in self._files:
-            print(text, end="", flush=flush, file=file)
+            file.write(text)
         return self
 
 printer = Printer()
\ No newline at end of file
@@ -19,6 +19,7 @@ EXAMPLES_PATH = Path("examples")
 DECLARATIONS_PATH = Path("declarations")
 COMPARISONS_PATH = Path("comparisons")
 CACHE_PATH = Path("cache")
+DONE_MARKER_PATH = Path(".done")
 TEMPLATE_PATH = CACHE_PATH / "template"
 PLAYGROUND_PATH = CACHE_PATH / "playground"
 EXTRACTION_PATH = Path("extraction")
@@ -2,6 +2,7 @@
 from dataclasses import dataclass
 import os
 from pathlib import Path
+import shlex
 import signal
 import subprocess
 import threading
@@ -9,6 +10,8 @@ from typing import Optional
 
 from dts_generation._utils._printer import printer
 
+MAX_LENGTH_SHELL_OUTPUT = 100_000
+
 class ShellError(Exception):
     pass
 
@@ -29,6 +32,12 @@ def shell(
     cwd: Optional[str | Path] = None,
     env: Optional[dict[str, str]] = None
 ) -> ShellOutput:
+    # Pooled example executions call this concurrently with verbose=False, and the
+    # with_verbose toggle and level bump on the shared printer are not thread-safe
+    # (lost level updates would mis-indent all later output), so the silent path
+    # must not touch the printer at all
+    if not verbose:
+        return _run(command, False, timeout, check, cwd, env)
     with printer.with_verbose(verbose):
         message = f"Shell"
         if timeout is not None:
@@ -40,50 +49,70 @@ def shell(
         printer(message + ":")
         with printer:
             printer(command)
-            proc = subprocess.Popen(
-                command,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1, # line-buffered text mode
-                universal_newlines=True,
-                cwd=cwd,
-                env=env,
-                shell=True,
-                start_new_session=True,
-            )
-            captured: list[str] = []
-            def _reader():
-                assert proc.stdout is not None
-                for line in proc.stdout:
-                    printer(line, end="")
-                    captured.append(line)
-            t = threading.Thread(target=_reader, daemon=True)
-            t.start()
-            timeout_error = False
+            return _run(command, True, timeout, check, cwd, env)
+
+def _run(
+    command: str,
+    echo: bool,
+    timeout: Optional[float],
+    check: bool,
+    cwd: Optional[str | Path],
+    env: Optional[dict[str, str]]
+) -> ShellOutput:
+    # No command uses pipes or redirections, so split the string and skip the /bin/sh fork
+    proc = subprocess.Popen(
+        shlex.split(command),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1, # line-buffered text mode
+        encoding="utf-8",
+        errors="replace", # tool output is not always clean UTF-8
+        cwd=cwd,
+        env=env,
+        start_new_session=True,
+    )
+    captured: list[str] = []
+    captured_length = 0
+    def _reader():
+        nonlocal captured_length
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            if echo:
+                printer(line, end="")
+            # Cap retained output so chatty or spinning commands cannot pin unbounded memory
+            if captured_length < MAX_LENGTH_SHELL_OUTPUT:
+                captured.append(line)
+                captured_length += len(line)
+    t = threading.Thread(target=_reader, daemon=True)
+    t.start()
+    timeout_error = False
+    try:
+        rc = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        timeout_error = True
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
             try:
-                rc = proc.wait(timeout=timeout)
-            except subprocess.TimeoutExpired:
-                timeout_error = True
-                try:
-                    os.killpg(proc.pid, signal.SIGTERM)
-                except ProcessLookupError:
-                    pass
-                try:
-                    proc.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    try:
-                        os.killpg(proc.pid, signal.SIGKILL)
-                    except ProcessLookupError:
-                        pass
-                    proc.wait()
-                rc = 124 # like GNU timeout
-            # Ensure we've drained stdout and the thread exited
-            t.join()
-            output = ShellOutput("".join(captured), rc, timeout_error)
-            if check and output.timeout:
-                raise ShellTimeoutError(f"Timeout after {timeout}s")
-            if check and output.code != 0:
-                raise ShellError(f"Non-Zero exit: {output.code}")
-            return output
\ No newline at end of file
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            proc.wait()
+        rc = 124 # like GNU timeout
+    # Ensure we've drained stdout and the thread exited
+    t.join()
+    value = "".join(captured)
+    if captured_length >= MAX_LENGTH_SHELL_OUTPUT:
+        value += "\n... (output truncated)"
+    output = ShellOutput(value, rc, timeout_error)
+    if check and output.timeout:
+        raise ShellTimeoutError(f"Timeout after {timeout}s")
+    if check and output.code != 0:
+        raise ShellError(f"Non-Zero exit: {output.code}")
+    return output
\ No newline at end of file